@@ -3,12 +3,27 @@
 
 import re
 import sys
+import asyncio
+import hashlib
+import functools
+import itertools
 
+import aiohttp
+import orjson
 import requests
+import requests_cache
 import urllib3
 import configparser
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from aiohttp_client_cache import CachedResponse, CachedSession, SQLiteBackend
+from aiohttp_client_cache import cache_control
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
+from typing import AsyncIterator, Iterator
 
 # CONSTANTS
 COLUMN = 'column'
@@ -16,6 +31,29 @@ ITEMS_NUMBER = 'items_number'
 MEAN_DURATION = 'mean_duration'
 OLDEST_DURATION = 'oldest_duration'
 OLDEST_NAME = 'oldest_name'
+MAX_CONCURRENT_REQUESTS = 16
+MAX_CONCURRENT_CHANGESETS_REQUESTS = 32
+# changesets of the artifacts are cached on disk for an hour, in
+# separate files for each access key. Other responses (trackers,
+# artifacts lists...) are never cached so that statistics stay current
+ACCESS_KEY_HEADER = 'X-Auth-AccessKey'
+CACHE_NAME = 'tuleap_cache'
+ASYNC_CACHE_NAME = 'tuleap_async_cache'
+CACHED_URLS = {
+    '*/artifacts/*/changesets': 3600
+}
+# biggest page size accepted by the tuleap API
+ARTIFACTS_PAGE_LIMIT = 1000
+# user input expected when choosing an item from a list
+_DIGIT_RE = re.compile(r'^\d+$')
+# units used to display durations, from the biggest to the smallest
+READABLE_TIME = [
+    ("year", 365.25 * 24 * 3600),
+    ("month", 30.44 * 24 * 3600),
+    ("day", 24 * 3600),
+    ("hour", 3600),
+    ("minute", 60)
+]
 AVAILABLE_FORMATS = [
     {
         'label': "CSV",
@@ -26,22 +64,78 @@ AVAILABLE_FORMATS = [
     }, {
         'label': "Excel",
         'ext': "xlsx"
+    }, {
+        'label': "Parquet",
+        'ext': "parquet"
     }
 ]
 
-# import configuration from '.ini' file
-config = configparser.ConfigParser()
-config.read('.ini')
-API_URL = config['TULEAP_API']['api_url']
-ACCESS_KEY = config['TULEAP_API']['access_key']
-API_PARAMS = {
-    'X-Auth-AccessKey': ACCESS_KEY
-}
-
 # suppress the warning linked to the deactivation of ssl verification
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_config() -> configparser.SectionProxy:
+    """
+    Imports the tuleap API configuration from the '.ini' file.
+    The file is only read on the first call\n
+    :return: (configparser.SectionProxy) tuleap API configuration
+    """
+    config = configparser.ConfigParser()
+    config.read('.ini')
+    return config['TULEAP_API']
+
+
+def _get_api_params() -> dict:
+    """
+    Returns the authentication headers of the tuleap API\n
+    :return: (dict) authentication headers
+    """
+    return {
+        ACCESS_KEY_HEADER: _load_config()['access_key']
+    }
+
+
+def _get_cache_name(name: str) -> str:
+    """
+    Returns the name of a cache dedicated to the configured access key,
+    so that responses are never shared between users. The key itself
+    is only stored as a hash\n
+    :param name: (str) base name of the cache\n
+    :return: (str) name of the cache for the access key
+    """
+    key_hash = hashlib.sha256(
+        _load_config()['access_key'].encode()).hexdigest()
+    return f"{name}_{key_hash[:16]}"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """
+    Returns the session shared by the requests made to the tuleap API,
+    so that connections (and TLS handshakes) are reused and changesets
+    are cached on disk between runs (see CACHED_URLS).
+    The session is created on the first call\n
+    :return: (requests.Session) shared session
+    """
+    session = requests_cache.CachedSession(
+        _get_cache_name(CACHE_NAME), backend='sqlite',
+        expire_after=requests_cache.DO_NOT_CACHE,
+        urls_expire_after=CACHED_URLS,
+        ignored_parameters=[ACCESS_KEY_HEADER]
+    )
+    session.mount('https://', HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+        )
+    ))
+    session.verify = False
+    session.headers.update(_get_api_params())
+    return session
+
+
 def get_user_projects(api: str) -> list:
     """
     Returns the list of visible projects for the user
@@ -50,8 +144,7 @@ def get_user_projects(api: str) -> list:
     :return: (list) list of the projects
     """
     url = f"{api}/projects"
-    raw_projects = requests.get(
-        url, params=API_PARAMS, verify=False).json()
+    raw_projects = orjson.loads(_get_session().get(url).content)
 
     return [
         {
@@ -64,50 +157,166 @@ def get_user_projects(api: str) -> list:
 def check_artifact_existence(api: str, tracker_id) -> bool:
     """
     Checks if a given tracker has some artifacts
-    by requesting artifacts from the tuleap API and checking
-    if the result of the request is empty or not\n
+    by requesting a single artifact from the tuleap API and checking
+    the total number of artifacts given by the pagination header\n
     :param api: (str) tuleap api to requests\n
     :param tracker_id: (str) id of the tracker to request\n
     :return: (bool): existence of artifacts for the tracker
     """
     url = f"{api}/trackers/{tracker_id}/artifacts"
-    return requests.get(url=url, params={
-        **API_PARAMS,
-        **{
-            'offset': 1
-        }
-    }, verify=False).json() or False
+    request = _get_session().get(url=url, params={
+        'limit': 1
+    })
+    return int(request.headers['X-PAGINATION-SIZE']) > 0
 
 
-def get_tuleap_artifacts(api: str, tracker_id: str) -> list:
+class _RedactedSQLiteBackend(SQLiteBackend):
     """
-    Requests artifacts from the tuleap API for given tracker.
-    If the requests is splitted into several pages, makes
-    several requests to get the whole dataset\n
-    :param api: (str) tuleap api to requests\n
-    :param tracker_id: (str) id of the tracker to request\n
-    :return: results: (list) data requested
+    SQLite cache of aiohttp responses that does not store the access key
+    among the request headers saved with each response
     """
 
-    url = f"{api}/trackers/{tracker_id}/artifacts"
-    offset, size, total_items = 0, 0, 0
-    results = []
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
-    while offset + size <= total_items:
-        request = requests.get(url=url, params={
-            **API_PARAMS,
-            **{
-                'offset': offset + size
-            }
-        }, verify=False)
+        # every response goes through this write, whatever the way
+        # the backend saves it, so the header is removed here
+        write = self.responses.write
 
-        offset = int(request.headers['X-PAGINATION-OFFSET'])
-        size = int(request.headers['X-PAGINATION-LIMIT'])
-        total_items = int(request.headers['X-PAGINATION-SIZE'])
+        async def write_redacted(key: str, item) -> None:
+            if isinstance(item, CachedResponse):
+                item.request_raw_headers = tuple(
+                    (name, value)
+                    for name, value in item.request_raw_headers
+                    if name.decode().lower() != ACCESS_KEY_HEADER.lower()
+                )
+            await write(key, item)
 
-        results += request.json()
+        self.responses.write = write_redacted
 
-    return results
+
+def _create_async_session(limit: int) -> aiohttp.ClientSession:
+    """
+    Creates an asynchronous session authenticated on the tuleap API,
+    sharing a pool of at most limit connections and caching
+    changesets on disk between runs (see CACHED_URLS)\n
+    :param limit: (int) maximum number of simultaneous connections\n
+    :return: (aiohttp.ClientSession) session to be used as a context manager
+    """
+    return CachedSession(
+        cache=_RedactedSQLiteBackend(
+            _get_cache_name(ASYNC_CACHE_NAME),
+            expire_after=cache_control.DO_NOT_CACHE,
+            urls_expire_after=CACHED_URLS,
+            ignored_params=[ACCESS_KEY_HEADER]
+        ),
+        connector=aiohttp.TCPConnector(limit=limit, ssl=False),
+        headers=_get_api_params()
+    )
+
+
+async def _fetch_json(
+        session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+        url: str, params: dict = None
+):
+    """
+    Requests a json resource from the tuleap API, waiting for
+    the semaphore to limit the number of concurrent requests\n
+    :param session: (aiohttp.ClientSession) session used to request\n
+    :param semaphore: (asyncio.Semaphore) concurrency limiter\n
+    :param url: (str) url to request\n
+    :param params: (dict) query parameters of the request\n
+    :return: decoded json response
+    """
+    async with semaphore:
+        async with session.get(url, params=params) as response:
+            return orjson.loads(await response.read())
+
+
+async def _iter_artifact_pages(url: str, offsets) -> AsyncIterator[list]:
+    """
+    Requests concurrently the artifacts pages starting at the given
+    offsets, sharing a single connection pool between requests.
+    At most MAX_CONCURRENT_REQUESTS pages are requested or waiting
+    to be consumed at the same time\n
+    :param url: (str) url of the tracker artifacts\n
+    :param offsets: (iterable) offsets of the pages to request\n
+    :return: (AsyncIterator[list]) pages of artifacts,
+        in the same order as offsets
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    offsets = iter(offsets)
+
+    async with _create_async_session(MAX_CONCURRENT_REQUESTS) as session:
+        def request_pages(number: int) -> list:
+            return [
+                asyncio.ensure_future(_fetch_json(session, semaphore, url, {
+                    'offset': offset,
+                    'limit': ARTIFACTS_PAGE_LIMIT
+                })) for offset in itertools.islice(offsets, number)
+            ]
+
+        pending = request_pages(MAX_CONCURRENT_REQUESTS)
+        try:
+            while pending:
+                page = await pending.pop(0)
+                # a new page is requested as soon as one is received
+                pending += request_pages(1)
+                yield page
+        finally:
+            for request in pending:
+                request.cancel()
+
+
+def iter_tuleap_artifacts(api: str, tracker_id: str) -> Iterator[dict]:
+    """
+    Yields artifacts from the tuleap API for given tracker, as they
+    are received, so that the whole dataset is never held in memory.
+    If the requests is splitted into several pages, the first page
+    gives the pagination and the remaining pages are requested
+    concurrently through a single session\n
+    :param api: (str) tuleap api to requests\n
+    :param tracker_id: (str) id of the tracker to request\n
+    :return: (Iterator[dict]) artifacts requested
+    """
+    url = f"{api}/trackers/{tracker_id}/artifacts"
+
+    request = _get_session().get(url=url, params={
+        'offset': 0,
+        'limit': ARTIFACTS_PAGE_LIMIT
+    })
+
+    size = int(request.headers['X-PAGINATION-LIMIT'])
+    total_items = int(request.headers['X-PAGINATION-SIZE'])
+
+    yield from orjson.loads(request.content)
+
+    # a single event loop drives the pages between two yields,
+    # so that the session and its connections are kept until the end
+    loop = asyncio.new_event_loop()
+    pages = _iter_artifact_pages(url, range(size, total_items, size))
+    try:
+        while True:
+            try:
+                page = loop.run_until_complete(pages.__anext__())
+            except StopAsyncIteration:
+                break
+            yield from page
+    finally:
+        loop.run_until_complete(pages.aclose())
+        loop.close()
+
+
+@functools.lru_cache(maxsize=64)
+def get_tuleap_artifacts(api: str, tracker_id: str) -> tuple:
+    """
+    Requests all the artifacts from the tuleap API for given tracker.
+    Results are memoized for each (api, tracker_id)\n
+    :param api: (str) tuleap api to requests\n
+    :param tracker_id: (str) id of the tracker to request\n
+    :return: results: (tuple) data requested
+    """
+    return tuple(iter_tuleap_artifacts(api, tracker_id))
 
 
 def get_human_duration(time: int) -> str:
@@ -119,129 +328,203 @@ def get_human_duration(time: int) -> str:
     :param time: (int) time in seconds\n
     :return: (str) duration time to be returned
     """
-
-    readable_time = [
-        ("year", 365.25 * 24 * 3600),
-        ("month", 30.24 * 24 * 3600),
-        ("day", 24 * 3600),
-        ("hour", 60),
-        ("minute", 60)
-    ]
-
-    human_time = ""
-
-    for date_type, division in readable_time:
-        reduce_time = time / division
-        time -= division * int(reduce_time)
-        time_to_display = int(reduce_time + .5)
+    for date_type, division in READABLE_TIME:
+        time_to_display = int(time / division + .5)
         if time_to_display > 0:
             if time_to_display > 1:
                 date_type += 's'
-            human_time = f"{time_to_display} {date_type}"
-            break
+            return f"{time_to_display} {date_type}"
+
+    return ""
+
+
+# units and durations of READABLE_TIME sorted in ascending order,
+# so that the unit of a duration can be found with a binary search
+_DURATION_NAMES = np.array([name for name, _ in reversed(READABLE_TIME)])
+_DURATION_DIVISIONS = np.array(
+    [division for _, division in reversed(READABLE_TIME)])
+
 
-    return human_time
+def get_human_durations(times) -> np.ndarray:
+    """
+    Vectorized version of get_human_duration, converting
+    a whole array of durations at once\n
+    :param times: (array-like) times in seconds\n
+    :return: (np.ndarray) durations to be returned
+    """
+    times = np.asarray(times, dtype=float)
+
+    # a duration is displayed with the biggest unit it reaches
+    # once rounded, i.e. half of the unit
+    indexes = np.searchsorted(
+        _DURATION_DIVISIONS / 2, times, side='right') - 1
+    units = indexes.clip(0)
+
+    times_to_display = np.floor(
+        times / _DURATION_DIVISIONS[units] + .5).astype(int)
+    human_times = np.char.add(
+        np.char.add(times_to_display.astype(str), " "),
+        np.char.add(
+            _DURATION_NAMES[units],
+            np.where(times_to_display > 1, "s", "")
+        )
+    )
 
+    return np.where(indexes >= 0, human_times, "")
 
-def get_project_trackers(api: str, project_uri: str) -> list:
+
+@functools.lru_cache(maxsize=64)
+def get_project_trackers(api: str, project_uri: str) -> tuple:
     """
-    Returns a list containing the id and labels of all trackers
-    associated to a given project\n
+    Returns a tuple containing the id and labels of all trackers
+    associated to a given project.
+    Results are memoized for each (api, project_uri)\n
     :param api: (str) tuleap api to requests\n
     :param project_uri: (int) id of the project to analyze\n
-    :return: (list) list of tracker info
+    :return: (tuple) tracker info
     """
     url = f"{api}/{project_uri}/trackers"
 
-    results = requests.get(url, params=API_PARAMS, verify=False).json()
-    return [
+    results = orjson.loads(_get_session().get(url).content)
+    return tuple(
         {
             'id': result['id'],
             'label': result['label']
         } for result in results
-    ]
+    )
 
 
-def get_columns_stats(artifacts: list) -> pd.DataFrame:
+def get_columns_stats(artifacts) -> pd.DataFrame:
     """
-    Extracts statistics from a list of artifacts\n
-    :param artifacts: (list) data to be analyzed\n
+    Extracts statistics from artifacts, which can be
+    consumed one by one from an iterator\n
+    :param artifacts: (iterable) data to be analyzed\n
     :return: stats (pd.DataFrame): resulting statistics
     """
     current_date = datetime.now(timezone.utc)
 
-    no_column_artifact_number = 0
-
-    # dataframe that will contain results
-    stats = pd.DataFrame(
-        columns=[
-            COLUMN,
-            ITEMS_NUMBER,
-            MEAN_DURATION,
-            OLDEST_DURATION,
-            OLDEST_NAME
-        ]
-    ).set_index(COLUMN)
-
+    # we get the column, the title and the submitted date of the artifacts
+    # and skip the artifacts that are not in any column
+    fields = {
+        'status': [],
+        'title': [],
+        'submitted_on': []
+    }
     for artifact in artifacts:
-        # we get the column and the submitted date of the artifact
-        column_name = artifact['status']
-        label = artifact['title']
-        submitted_date_str = artifact['submitted_on'][:-3] + "00"
-
-        if column_name == "":
-            no_column_artifact_number += 1
+        if artifact['status'] == "":
             continue
 
-        # the date is converted into python date
-        submitted_date = datetime.strptime(
-            submitted_date_str, '%Y-%m-%dT%H:%M:%S%z')
-        duration = (current_date - submitted_date).total_seconds()
+        for field, values in fields.items():
+            values.append(artifact[field])
 
-        if column_name not in stats.index:
-            stats.loc[column_name] = [
-                1, duration, submitted_date, label
-            ]
-        else:
-            stats.loc[column_name, ITEMS_NUMBER] += 1
-            stats.loc[column_name, MEAN_DURATION] += duration
+    # the dataframe is built once from the collected columns
+    artifacts = pd.DataFrame(fields, dtype=str)
 
-            if submitted_date < stats.loc[column_name, OLDEST_DURATION]:
-                stats.loc[column_name, OLDEST_DURATION] = submitted_date
-                stats.loc[column_name, OLDEST_NAME] = label
+    # the dates are converted into pandas dates all at once
+    artifacts['submitted_date'] = pd.to_datetime(
+        artifacts['submitted_on'].str.slice(0, -3) + "00",
+        format='%Y-%m-%dT%H:%M:%S%z', utc=True, cache=True
+    )
+    artifacts['duration'] = (
+        current_date - artifacts['submitted_date']
+    ).dt.total_seconds()
+
+    # the artifacts are aggregated by column
+    columns = artifacts.groupby('status', sort=False)
+    oldest = columns['submitted_date'].idxmin()
+
+    # dataframe that will contain results
+    stats = pd.DataFrame({
+        ITEMS_NUMBER: columns.size(),
+        MEAN_DURATION: columns['duration'].sum(),
+        # the oldest date is displayed in the artifact's own timezone
+        OLDEST_DURATION: pd.to_datetime(
+            artifacts.loc[oldest, 'submitted_on'].str.slice(0, -6),
+            format='%Y-%m-%dT%H:%M:%S'
+        ).to_numpy(),
+        OLDEST_NAME: artifacts.loc[oldest, 'title'].to_numpy()
+    })
+    stats.index.name = COLUMN
 
     # calculates the mean duration time for each column
-    stats[MEAN_DURATION] = stats.apply(
-        lambda df: df[MEAN_DURATION] / df[ITEMS_NUMBER], axis=1
-    )
+    stats[MEAN_DURATION] = stats[MEAN_DURATION] / stats[ITEMS_NUMBER]
 
     # duration time is converted in a more readable format
-    stats[MEAN_DURATION] = stats[MEAN_DURATION].map(
-        get_human_duration)
-
-    stats[OLDEST_DURATION] = stats[OLDEST_DURATION].map(
-        lambda t: datetime.replace(t, tzinfo=None)
-    )
+    stats[MEAN_DURATION] = get_human_durations(
+        stats[MEAN_DURATION].to_numpy())
 
     return stats
 
 
-def get_artifact_changesets(artifact: dict):
+def get_artifact_changesets(artifact: dict) -> None:
+    """
+    Requests the changesets of an artifact from the tuleap API
+    and displays its status history\n
+    :param artifact: (dict) artifact to analyze\n
+    :return: (None)
+    """
+    url = f"{_load_config()['api_url']}/artifacts/{artifact['id']}/changesets"
+
+    changesets = orjson.loads(_get_session().get(url).content)
+    analyze_artifact_changesets(artifact, changesets)
+
+
+async def fetch_changesets_bulk(artifacts) -> list:
+    """
+    Requests concurrently the changesets of several artifacts
+    from the tuleap API\n
+    :param artifacts: (list) artifacts whose changesets are requested\n
+    :return: (list) changesets of each artifact, in the same order
+    """
+    api = _load_config()['api_url']
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHANGESETS_REQUESTS)
+
+    async with _create_async_session(
+            MAX_CONCURRENT_CHANGESETS_REQUESTS) as session:
+        return await asyncio.gather(*[
+            _fetch_json(
+                session, semaphore,
+                f"{api}/artifacts/{artifact['id']}/changesets"
+            ) for artifact in artifacts
+        ])
+
+
+def get_all_artifact_changesets(artifacts) -> None:
+    """
+    Same as get_artifact_changesets for several artifacts,
+    whose changesets are all requested concurrently\n
+    :param artifacts: (list | tuple) artifacts to analyze\n
+    :return: (None)
+    """
+    artifacts = list(artifacts)
+    all_changesets = asyncio.run(fetch_changesets_bulk(artifacts))
+
+    for artifact, changesets in zip(artifacts, all_changesets):
+        analyze_artifact_changesets(artifact, changesets)
+
+
+def analyze_artifact_changesets(artifact: dict, changesets: list) -> None:
+    """
+    Displays the status history of an artifact from its changesets\n
+    :param artifact: (dict) analyzed artifact\n
+    :param changesets: (list) changesets of the artifact\n
+    :return: (None)
+    """
     permanent_youngest_date = None
     youngest_date = None
 
-    url = f"{API_URL}/artifacts/{artifact['id']}/changesets"
-
-    changesets = requests.get(url, params=API_PARAMS,
-                              verify=False).json()
+    # the dates of all changesets are converted at once
+    submitted_dates = pd.to_datetime(
+        pd.Series(
+            [changeset['submitted_on'] for changeset in changesets],
+            dtype=str
+        ).str.slice(0, -6),
+        format='%Y-%m-%dT%H:%M:%S', cache=True
+    )
 
     status = []
     dates = []
-    for changeset in changesets:
-        submitted_on = datetime.strptime(
-            changeset['submitted_on'][:-6],
-            '%Y-%m-%dT%H:%M:%S'
-        )
+    for changeset, submitted_on in zip(changesets, submitted_dates):
         values = changeset['values']
 
         # convert if needed values in a list
@@ -274,12 +557,12 @@ def get_artifact_changesets(artifact: dict):
         print(f"{artifact['title']} ({artifact['id']})")
 
 
-def ask_user(items: list, item_name) -> dict:
+def ask_user(items, item_name) -> dict:
     """
     Generic function that asks user to select an item
     from a list of items by choosing a number.
     If no items are available, stops the execution.\n
-    :param items: (list) list of available items.
+    :param items: (list | tuple) available items.
         Each item must be a dict containing the key 'label'\n
     :param item_name: () name to be displayed for the user\n
     :return: (dict): item selected by the user
@@ -301,7 +584,7 @@ def ask_user(items: list, item_name) -> dict:
     while True:
         number_choosen = input(
             f"Entrez un nombre entre 1 et {len(items)} : ")
-        if re.match('^\d+$', number_choosen):
+        if _DIGIT_RE.match(number_choosen):
             if 1 <= int(number_choosen) <= len(items):
                 selected_item = items[int(number_choosen) - 1]
                 print(f"Vous avez sélectionné le {item_name} "
@@ -333,14 +616,28 @@ def create_file(
         writer.sheets[tracker_name].set_column('A:D', 18)
         writer.sheets[tracker_name].set_column('D:D', 20)
         writer.sheets[tracker_name].set_column('E:E', 30)
-        writer.save()
+        writer.close()
     elif output_format == "csv":
-        results.to_csv(filename)
+        table = pa.Table.from_pandas(
+            results.reset_index(), preserve_index=False)
+
+        # dates are written to the second, as pandas does
+        oldest_index = table.schema.get_field_index(OLDEST_DURATION)
+        table = table.set_column(
+            oldest_index, OLDEST_DURATION,
+            table[OLDEST_DURATION].cast(pa.timestamp('s'))
+        )
+
+        pa_csv.write_csv(table, filename)
     elif output_format == "json":
         results.to_json(filename)
+    elif output_format == "parquet":
+        results.to_parquet(filename, engine='pyarrow', compression='zstd')
 
 
 if __name__ == '__main__':
+    API_URL = _load_config()['api_url']
+
     projects = get_user_projects(API_URL)
     project_uri = ask_user(projects, 'projet')['uri']
 
@@ -355,7 +652,7 @@ if __name__ == '__main__':
     selected_format = ask_user(AVAILABLE_FORMATS, "format")['ext']
 
     stats = get_columns_stats(
-        get_tuleap_artifacts(API_URL, selected_tracker["id"])
+        iter_tuleap_artifacts(API_URL, selected_tracker["id"])
     )
 
     create_file(